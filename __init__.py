@@ -3,11 +3,6 @@ import os
 from pathlib import Path
 from typing import Optional
 
-# Assuming logger setup is desired when the package is imported,
-# or it's handled per-operation.
-# from .src.logger import setup_logger
-# logger = setup_logger('FileSystemToolLogger', 'filesystemtool.log') # Or configure path better
-
 from .src.file_operations import FileOperations
 from .src.package_manager import PackageManager
 from .src.node import Node
@@ -52,7 +47,3 @@ __all__ = [
     "recreate_structure_from_file",
     "setup_logger" # Expose if users need to create custom loggers
 ]
-
-# Consider where logger is initialized. If it's module-global,
-# its file path needs careful consideration (e.g., user's home dir, temp dir).
-# For a CLI tool, logging might be configured per command.
\ No newline at end of file
@@ -1,14 +1,9 @@
 import argparse
 import logging
+import sys
 from pathlib import Path
 
-from src import (
-    create_structure_from_file,
-    output_directory_structure,
-    recreate_structure_from_file,
-)
-
-from src.settings import DEFAULT_ENCODING, LOGGING
+from .settings import DEFAULT_ENCODING, LOGGING
 
 
 # =========================================================
@@ -43,6 +38,45 @@ def get_logger(level_str="INFO", log_file=DEFAULT_LOG_FILE):
     return logger
 
 
+# =========================================================
+# COMMAND HANDLERS (DEFERRED IMPORTS)
+# =========================================================
+# Each handler imports the engine only when its command runs,
+# so argument errors and --help do not load it.
+
+def _do_blueprint(args, logger):
+    from .file_operations import FileOperations
+
+    FileOperations(args.root, logger).create_structure_from_file(
+        args.structure_file
+    )
+
+
+def _do_snapshoot(args, logger):
+    from .file_operations import FileOperations
+
+    FileOperations(args.root_directory, logger).output_directory_structure(
+        root_dir_to_scan=args.root_directory,
+        output_file_path=args.out_file,
+        include_contents=args.include_contents
+    )
+
+
+def _do_recreate(args, logger):
+    # the engine has no recreate_structure_from_file yet
+    raise NotImplementedError(
+        "recreate is not implemented: FileOperations has no "
+        "recreate_structure_from_file"
+    )
+
+
+DISPATCH = {
+    "blueprint": _do_blueprint,
+    "snapshoot": _do_snapshoot,
+    "recreate": _do_recreate,
+}
+
+
 # =========================================================
 # STRICT COMMAND DISPATCH (NO LOGIC HERE)
 # =========================================================
@@ -74,6 +108,7 @@ def main():
     )
     p_blueprint.add_argument("structure_file")
     p_blueprint.add_argument("--root", default=Path.cwd())
+    p_blueprint.set_defaults(func=DISPATCH["blueprint"])
 
     # -----------------------------------------------------
     # snapshoot (was output)
@@ -85,6 +120,7 @@ def main():
     p_snap.add_argument("root_directory")
     p_snap.add_argument("-o", "--out-file")
     p_snap.add_argument("-c", "--include-contents", action="store_true")
+    p_snap.set_defaults(func=DISPATCH["snapshoot"])
 
     # -----------------------------------------------------
     # recreate
@@ -96,6 +132,7 @@ def main():
     p_recreate.add_argument("structure_definition_file")
     p_recreate.add_argument("files_content_file")
     p_recreate.add_argument("--root", default=Path.cwd())
+    p_recreate.set_defaults(func=DISPATCH["recreate"])
 
 
 
@@ -104,57 +141,17 @@ def main():
     logger = get_logger(args.log_level, args.log_file)
 
     logger.info(f"Command: {args.command}")
-    logger.debug(f"Args: {vars(args)}")
+    logger.debug("Args: %s", vars(args))
 
     # =====================================================
     # COMMAND ROUTER (PURE DELEGATION ONLY)
     # =====================================================
 
     try:
-
-        # -------------------------
-        # BLUEPRINT
-        # -------------------------
-        if args.command == "blueprint":
-            create_structure_from_file(
-                args.structure_file,
-                args.root,
-                logger_instance=logger
-            )
-
-        # -------------------------
-        # SNAPSHOT (NO PATH FIXES)
-        # -------------------------
-        elif args.command == "snapshoot":
-            output_directory_structure(
-                args.root_directory,
-                args.out_file,
-                args.include_contents,
-                logger_instance=logger
-            )
-
-        # -------------------------
-        # RECREATE
-        # -------------------------
-        elif args.command == "recreate":
-            recreate_structure_from_file(
-                args.structure_definition_file,
-                args.files_content_file,
-                args.root,
-                logger_instance=logger
-            )
-
-        # -------------------------
-        # INSTALL (delegated)
-        # -------------------------
-        elif args.command == "install":
-            # intentionally not implemented here
-            # should be moved to engine/service layer
-            raise NotImplementedError(
-                "Install should be handled in engine layer (not CLI)"
-            )
+        args.func(args, logger)
 
         logger.info(f"Completed: {args.command}")
+        return 0
 
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")
@@ -164,14 +161,20 @@ def main():
         logger.error(f"Invalid input: {e}")
         print(f"ERROR: {e}")
 
+    except NotImplementedError as e:
+        logger.error(f"Not implemented: {e}")
+        print(f"ERROR: {e}")
+
     except Exception as e:
         logger.exception("Unhandled CLI error")
         print(f"ERROR: unexpected error (check logs at {args.log_file})")
 
+    return 1
+
 
 # =========================================================
 # ENTRY POINT
 # =========================================================
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -2,7 +2,9 @@ import os
 import re
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
 from .node import Node
@@ -16,9 +18,121 @@ from .settings import (
     ERROR_HANDLING,
     FILE_CONTENT_MARKERS,
     DIRECTORY_STRUCTURE_INDICATORS,
+    MAX_IO_WORKERS,
 )
 
 
+# =========================================================
+# PRECOMPILED PATTERNS
+# =========================================================
+
+_RE_REPLACE_CHARS = re.compile(REPLACE_CHARACTERS)
+
+# REPLACE_CHARACTERS is a character class, so its members (plus brackets)
+# can be mapped in one C-level translate pass instead of two regex passes.
+# The table only covers ASCII; non-ASCII names also get the regex pass so
+# a non-ASCII member of the class is still replaced.
+_SANITIZE_TABLE = str.maketrans({
+    c: REPLACEMENT_CHARACTER
+    for c in map(chr, range(128))
+    if _RE_REPLACE_CHARS.fullmatch(c) or c in "(){}[]"
+})
+
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_TREE_PREFIX = re.compile(r'[│├└─\s]*')
+
+# Any character sanitize_name would rewrite; a name without one is clean
+_RE_DIRTY = re.compile(
+    '[' + re.escape(''.join(map(chr, _SANITIZE_TABLE))) + r'\s]'
+)
+
+
+@lru_cache(maxsize=8)
+def _split_ignored_extensions(extensions: frozenset) -> Tuple[frozenset, Tuple[str, ...]]:
+    """
+    Split an ignored-extension list for fast per-file checks: plain
+    extensions ('.pyc') are looked up by the text from a name's last dot;
+    whole file names and compound suffixes ('package.json') are matched
+    with one endswith(tuple). Cached per distinct list.
+    """
+    ext_set = frozenset(e for e in extensions if e.startswith('.') and e.count('.') == 1)
+    return ext_set, tuple(e for e in extensions if e not in ext_set)
+
+
+@lru_cache(maxsize=8192)
+def _sanitize_name(name: str) -> str:
+    """
+    Pure sanitization core behind FileOperations.sanitize_name.
+    Cached because trees repeat names (__init__.py, README.md, ...).
+    """
+    if (
+        name
+        and len(name) <= MAX_NAME_LENGTH
+        and name.strip(REPLACEMENT_CHARACTER) == name
+        and not _RE_DIRTY.search(name)
+        and (name.isascii() or not _RE_REPLACE_CHARS.search(name))
+    ):
+        return name
+
+    if not name.isascii():
+        name = _RE_REPLACE_CHARS.sub(REPLACEMENT_CHARACTER, name)
+
+    sanitized = name.translate(_SANITIZE_TABLE)
+    sanitized = _RE_WHITESPACE.sub(REPLACEMENT_CHARACTER, sanitized)
+
+    sanitized = sanitized.strip(REPLACEMENT_CHARACTER)
+
+    if not sanitized:
+        return "untitled"
+
+    if len(sanitized) > MAX_NAME_LENGTH:
+        base, ext = os.path.splitext(sanitized)
+        allowed = MAX_NAME_LENGTH - len(ext)
+        sanitized = base[:allowed] + ext
+
+    return sanitized
+
+
+# =========================================================
+# FILE I/O HELPERS
+# =========================================================
+
+# Raw-fd writes skip text mode, so newline translation is done by hand
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_TRANSLATE_NEWLINES = os.linesep != "\n"
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path through a raw file descriptor (no TextIOWrapper)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Files read concurrently per batch when a snapshot includes contents
+_SNAPSHOT_READ_BATCH = 64
+
+# Snapshot lines are buffered and written in chunks of this many lines
+_SNAPSHOT_FLUSH_LINES = 4096
+_SNAPSHOT_WRITE_BUFFER = 1 << 20
+
+
+def _read_snapshot_file(path: str):
+    """
+    Read a file for snapshot output.
+    Errors are returned (not raised) so one bad file does not stop the batch.
+    """
+    try:
+        with open(path, encoding=DEFAULT_ENCODING, errors="ignore") as fh:
+            return fh.read()
+    except Exception as e:
+        return e
+
+
 # =========================================================
 # PATH RESOLUTION (NO AMBIGUITY CORE RULE)
 # =========================================================
@@ -56,25 +170,47 @@ class FileOperations:
         self.project_root: Path = PathResolver.resolve(project_root)
         self.logger = logger
 
+        # Bound log methods and level check, resolved once per instance
+        self._log_info = logger.info
+        self._log_error = logger.error
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Error-reporting switches, read once from settings
+        self._log_errors = ERROR_HANDLING.get("log_errors", True)
+        self._print_errors = ERROR_HANDLING.get("print_errors", True)
+
         self.ignored_extensions = IGNORED_FILE_EXTENSIONS
         self.ignored_directories = IGNORED_DIRECTORIES
 
+        # Structure-file marker, looked up once instead of per parsed line
+        self._dir_indicator = DIRECTORY_STRUCTURE_INDICATORS['directory']
+
     # =====================================================
     # SAFE FILE SYSTEM PRIMITIVES
     # =====================================================
 
-    def create_directory(self, dir_path: Path) -> None:
+    def create_directory(self, dir_path: Union[str, Path]) -> bool:
         try:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Created directory: {dir_path}")
+            os.makedirs(dir_path, exist_ok=True)
+            if self._info_enabled:
+                self._log_info(f"Created directory: {dir_path}")
+            return True
         except Exception as e:
             self.handle_error(f"Directory creation failed: {dir_path} -> {e}")
+            return False
 
-    def create_file(self, file_path: Path, content: str = "") -> None:
+    def create_file(self, file_path: Union[str, Path], content: str = "", ensure_parent: bool = True) -> None:
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding=DEFAULT_ENCODING)
-            self.logger.info(f"Created file: {file_path}")
+            file_str = os.fspath(file_path)
+            if ensure_parent:
+                parent = os.path.dirname(file_str)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+            if _TRANSLATE_NEWLINES:
+                content = content.replace("\n", os.linesep)
+            _write_bytes(file_str, content.encode(DEFAULT_ENCODING))
+            if self._info_enabled:
+                self._log_info(f"Created file: {file_path}")
         except Exception as e:
             self.handle_error(f"File creation failed: {file_path} -> {e}")
 
@@ -83,27 +219,13 @@ class FileOperations:
     # =====================================================
 
     def sanitize_name(self, name: str) -> str:
-        sanitized = re.sub(REPLACE_CHARACTERS, REPLACEMENT_CHARACTER, name)
-        sanitized = re.sub(r'[(){}\[\]]', REPLACEMENT_CHARACTER, sanitized)
-        sanitized = re.sub(r'\s+', REPLACEMENT_CHARACTER, sanitized)
-
-        sanitized = sanitized.strip(REPLACEMENT_CHARACTER)
-
-        if not sanitized:
-            return "untitled"
-
-        if len(sanitized) > MAX_NAME_LENGTH:
-            base, ext = os.path.splitext(sanitized)
-            allowed = MAX_NAME_LENGTH - len(ext)
-            sanitized = base[:allowed] + ext
-
-        return sanitized
+        return _sanitize_name(name)
 
     # =====================================================
     # STRUCTURE PARSING (NO SIDE EFFECTS)
     # =====================================================
 
-    def _parse_structure_lines(self, lines: List[str]) -> Node:
+    def _parse_structure_lines(self, lines: Iterable[str]) -> Node:
         root = Node("root", is_directory=True)
         stack: List[Tuple[int, Node]] = [(-1, root)]
 
@@ -111,14 +233,15 @@ class FileOperations:
         current_content = []
         base_indent = -1
 
+        dir_ind = self._dir_indicator
+
         for line in lines:
             raw = line.rstrip("\n\r")
-            stripped = re.sub(r'^[│├└─\s]*', '', raw)
-
-            if not stripped.strip():
+            # blank or glyph-only line: one engine call, no stripped copy
+            if _RE_TREE_PREFIX.fullmatch(raw):
                 continue
 
-            indent = len(raw) - len(raw.replace(' ',""))
+            indent = raw.count(' ')
          
             name = raw.lstrip(' ').lstrip('│├└─ ').rstrip('/')
 
@@ -138,7 +261,7 @@ class FileOperations:
             # -----------------------------
             # NODE TYPE
             # -----------------------------
-            is_dir = raw.endswith(DIRECTORY_STRUCTURE_INDICATORS['directory'])
+            is_dir = raw.endswith(dir_ind)
 
             
 
@@ -172,16 +295,59 @@ class FileOperations:
     # TREE CREATION (SIDE EFFECT LAYER)
     # =====================================================
 
-    def _create_from_node_tree(self, node: Node, base: Path) -> None:
-        
-        for child in node.children:
-            target = base / child.name
+    def _create_from_node_tree(self, node: Node, base: str) -> None:
+        # Directories first, in tree order, so every parent exists;
+        # file writes are independent and run on a thread pool.
+        # Keyed by target: a repeated file entry overwrites the earlier
+        # one, so each path is written exactly once.
+        files: Dict[str, Tuple[str, bool]] = {}
+        self._create_directories_from_node_tree(node, base, files)
+
+        if not files:
+            return
+
+        with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as pool:
+            for target, (content, ensure_parent) in files.items():
+                pool.submit(self.create_file, target, content, ensure_parent)
+
+    def _create_directories_from_node_tree(
+        self,
+        node: Node,
+        base: str,
+        files: Dict[str, Tuple[str, bool]]
+    ) -> None:
+
+        # explicit stack of child iterators: the same depth-first pre-order
+        # as recursion, without the recursion limit on deep trees
+        stack: List[Tuple[Iterator[Node], str]] = [(iter(node.children), base)]
+
+        # directories created during this build; skips repeat mkdirs and
+        # lets their files skip the parent check
+        created: Set[str] = set()
+
+        while stack:
+            children, current_path = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                continue
+
+            target = os.path.join(current_path, child.name)
 
             if child.is_directory:
-                self.create_directory(target)
-                self._create_from_node_tree(child, target)
+                # a file of the same name listed earlier is written
+                # first, as a sequential build would, so the mkdir
+                # fails on it rather than the file write failing
+                pending = files.pop(target, None)
+                if pending is not None:
+                    self.create_file(target, *pending)
+
+                if target not in created and self.create_directory(target):
+                    created.add(target)
+                stack.append((iter(child.children), target))
             else:
-                self.create_file(target, child.content or "")
+                files[target] = (child.content or "", current_path not in created)
 
     # =====================================================
     # PUBLIC API: CREATE STRUCTURE
@@ -194,10 +360,11 @@ class FileOperations:
         if not path.exists():
             raise FileNotFoundError(f"Structure file not found: {path}")
 
-        lines = path.read_text(encoding=DEFAULT_ENCODING).splitlines()
+        # stream lines straight into the parser; no full-file list
+        with path.open("r", encoding=DEFAULT_ENCODING) as lines:
+            root = self._parse_structure_lines(lines)
 
-        root = self._parse_structure_lines(lines)
-        self._create_from_node_tree(root, self.project_root)
+        self._create_from_node_tree(root, str(self.project_root))
 
     # =====================================================
     # OUTPUT STRUCTURE (READ ONLY)
@@ -220,48 +387,107 @@ class FileOperations:
         else:
             out = Path.cwd() / f"structure_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
-        with out.open("w", encoding=DEFAULT_ENCODING) as f:
+        # read per call, so per-instance changes to either list apply
+        ignored_ext_set, ignored_name_suffixes = _split_ignored_extensions(
+            frozenset(self.ignored_extensions)
+        )
+        ignored_directories = self.ignored_directories
 
-            for dirpath, dirnames, filenames in os.walk(root):
+        pool = ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) if include_contents else None
 
-                dirpath = Path(dirpath)
+        try:
+            with out.open("w", encoding=DEFAULT_ENCODING, buffering=_SNAPSHOT_WRITE_BUFFER) as f:
 
-                dirnames[:] = [
-                    d for d in dirnames
-                    if d not in self.ignored_directories
-                ]
+                buf: List[str] = []
+                append = buf.append
 
-                rel = dirpath.relative_to(root)
-                level = len(rel.parts)
+                # per-depth prefixes, grown on demand: [indent, file, content]
+                prefixes: List[Tuple[str, str, str]] = [("", "├── ", "│   ")]
 
-                indent = "│   " * level
+                # explicit pre-order stack; same visiting order as os.walk
+                stack: List[Tuple[str, int]] = [(str(root), 0)]
 
-                f.write(f"{indent}{dirpath.name}/\n")
+                while stack:
+                    current, level = stack.pop()
 
-                for file in filenames:
-                    if any(file.endswith(ext) for ext in self.ignored_extensions):
+                    try:
+                        with os.scandir(current) as it:
+                            entries = list(it)
+                    except OSError:
                         continue
 
-                    f.write(f"{indent}├── {file}\n")
+                    subdirs: List[str] = []
+                    filenames: List[str] = []
 
-                    if include_contents:
+                    for entry in entries:
                         try:
-                            content = (dirpath / file).read_text(
-                                encoding=DEFAULT_ENCODING,
-                                errors="ignore"
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        if not is_dir:
+                            filenames.append(entry.name)
+                        elif entry.name not in ignored_directories and not entry.is_symlink():
+                            subdirs.append(entry.path)
+
+                    while len(prefixes) <= level:
+                        deeper = prefixes[-1][0] + "│   "
+                        prefixes.append((deeper, deeper + "├── ", deeper + "│   "))
+                    indent, file_prefix, content_prefix = prefixes[level]
+
+                    append(f"{indent}{os.path.basename(current)}/\n")
+
+                    filenames = [
+                        name for name in filenames
+                        if name[name.rfind('.'):] not in ignored_ext_set
+                        and not name.endswith(ignored_name_suffixes)
+                    ]
+
+                    if not include_contents:
+                        for file in filenames:
+                            append(f"{file_prefix}{file}\n")
+
+                            if len(buf) >= _SNAPSHOT_FLUSH_LINES:
+                                f.writelines(buf)
+                                buf.clear()
+                    else:
+                        for i in range(0, len(filenames), _SNAPSHOT_READ_BATCH):
+                            batch = filenames[i:i + _SNAPSHOT_READ_BATCH]
+                            contents = pool.map(
+                                _read_snapshot_file,
+                                [os.path.join(current, name) for name in batch]
                             )
-                            for line in content.splitlines():
-                                f.write(f"{indent}│   {line}\n")
-                        except Exception as e:
-                            self.handle_error(str(e))
+
+                            for file, content in zip(batch, contents):
+                                append(f"{file_prefix}{file}\n")
+
+                                if isinstance(content, Exception):
+                                    self.handle_error(str(content))
+                                else:
+                                    for line in content.splitlines():
+                                        append(f"{content_prefix}{line}\n")
+
+                                # flush per file: one large directory must
+                                # not hold all of its contents in buf
+                                if len(buf) >= _SNAPSHOT_FLUSH_LINES:
+                                    f.writelines(buf)
+                                    buf.clear()
+
+                    child_level = level + 1
+                    stack.extend((d, child_level) for d in reversed(subdirs))
+
+                f.writelines(buf)
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
     # =====================================================
     # ERROR HANDLING (SINGLE GATEWAY)
     # =====================================================
 
     def handle_error(self, message: str) -> None:
-        if ERROR_HANDLING.get("log_errors"):
-            self.logger.error(message)
+        if self._log_errors:
+            self._log_error(message)
 
-        if ERROR_HANDLING.get("print_errors"):
+        if self._print_errors:
             print(f"ERROR: {message}")
\ No newline at end of file
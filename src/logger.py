@@ -1,22 +1,42 @@
+import atexit
 import logging
+from logging.handlers import MemoryHandler
+from pathlib import Path
+from typing import Set, Tuple
 from .settings import LOGGING
 
+# (name, log_file) pairs that already have a handler attached
+_configured: Set[Tuple[str, str]] = set()
+
 def setup_logger(name: str, log_file: str) -> logging.Logger:
     """
     Set up a logger with the specified name and log file.
+    Repeated calls with the same name and file return the existing logger
+    instead of attaching another handler.
 
     :param name: Name of the logger.
     :param log_file: Path to the log file.
     :return: Configured logger instance.
     """
+    key = (name, log_file)
+    if key in _configured:
+        return logging.getLogger(name)
+
     logger = logging.getLogger(name)
-    logger.setLevel(LOGGING['loggers'][name]['level'])
+    # Names without an entry in LOGGING (e.g. the package API defaults) log at INFO
+    logger.setLevel(LOGGING['loggers'].get(name, {}).get('level', 'INFO'))
+
+    # Create a file handler; the log directory may not exist on first run
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOGGING['formatters']['default']['format']))
 
-    # Create a file handler
-    handler = logging.FileHandler(log_file, encoding='utf-8')
-    handler.setFormatter(logging.Formatter(LOGGING['formatters']['default']['format']))
+    # Batch records in memory; errors (and a full buffer) flush to the file
+    handler = MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+    atexit.register(handler.flush)
 
     # Add the handler to the logger
     logger.addHandler(handler)
+    _configured.add(key)
 
     return logger
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import List, Optional
 
 class Node:
+    __slots__ = ('name', 'is_directory', 'children', 'content')
+
     def __init__(self, name: str, is_directory: bool = False, content: Optional[str] = None):
         self.name: str = name
         self.is_directory: bool = is_directory
@@ -4,6 +4,9 @@ from pathlib import Path
 # Base directory for the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Default log file; its directory is created by setup_logger on first use
+LOG_FILE = BASE_DIR / 'logs' / 'file_system_tool.log'
+
 # Logging configuration
 LOGGING = {
     'version': 1,
@@ -12,7 +15,7 @@ LOGGING = {
         'file': {
             'level': 'INFO',
             'class': 'logging.FileHandler',
-            'filename': os.path.join(BASE_DIR, 'logs', 'file_system_tool.log'),
+            'filename': str(LOG_FILE),
             'encoding': 'utf-8',
             'formatter': 'default',
         },
@@ -36,16 +39,17 @@ LOGGING = {
     },
 }
 # List of file extensions to ignore
-IGNORED_FILE_EXTENSIONS = [
+IGNORED_FILE_EXTENSIONS = frozenset({
     '.pyc', '.log', '.tmp', '.lnk', '.inf', '.jpg', '.zip', '.webp', '.jpeg', '.bat','.png','.drawio',
     '.sqlite3', '.gitignore', 'package-lock.json', 'package.json', '.dockerignore',
     '404.html','500.html','css.css','js.js','Dockerfile','manage.py',
-]
+})
 
 # List of directory names to ignore
-IGNORED_DIRECTORIES = [
+IGNORED_DIRECTORIES = frozenset({
     'interface','node_modules', '__pycache__', '.git','Dockerfile', '.vscode', 'venv', 'migrations', 'staticfiles','search','theme','media','ffmpeg-7.1-essentials_build',
-]
+    '.venv', '.tox', '.nox', '.mypy_cache', '.pytest_cache', '.ruff_cache',
+})
 IGNORED_PATH=[]
 
 # List of packages to ignore during installation
@@ -80,6 +84,9 @@ MAX_NAME_LENGTH = 255
 # Default encoding for file operations
 DEFAULT_ENCODING = 'utf-8'
 
+# Worker threads for I/O-bound batches (file creation, snapshot reads)
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Default root directory for project operations
 DEFAULT_ROOT_DIRECTORY = os.path.join(BASE_DIR, 'project_root')
 
@@ -1,9 +1,37 @@
 import unittest
+import importlib
+import os
+import re
+import random
+import shutil
+import tempfile
 from pathlib import Path
+from unittest.mock import patch
+from project.src import file_operations, settings
 from project.src.file_operations import FileOperations
-from project.src.settings import IGNORED_FILE_EXTENSIONS, IGNORED_DIRECTORIES
+from project.src.settings import (
+    IGNORED_FILE_EXTENSIONS,
+    IGNORED_DIRECTORIES,
+    MAX_NAME_LENGTH,
+    REPLACE_CHARACTERS,
+    REPLACEMENT_CHARACTER,
+)
 import logging
 
+
+def reference_sanitize_name(name):
+    """Straightforward regex form of sanitize_name, used as the oracle."""
+    sanitized = re.sub(REPLACE_CHARACTERS, REPLACEMENT_CHARACTER, name)
+    sanitized = re.sub(r'[(){}\[\]]', REPLACEMENT_CHARACTER, sanitized)
+    sanitized = re.sub(r'\s+', REPLACEMENT_CHARACTER, sanitized)
+    sanitized = sanitized.strip(REPLACEMENT_CHARACTER)
+    if not sanitized:
+        return "untitled"
+    if len(sanitized) > MAX_NAME_LENGTH:
+        base, ext = os.path.splitext(sanitized)
+        sanitized = base[:MAX_NAME_LENGTH - len(ext)] + ext
+    return sanitized
+
 class TestFileOperations(unittest.TestCase):
     def setUp(self):
         """Set up the test environment."""
@@ -34,5 +62,203 @@ class TestFileOperations(unittest.TestCase):
         self.assertFalse(ignored_file.exists())
         self.assertFalse(ignored_dir.exists())
 
+class TestStructureOperations(unittest.TestCase):
+    def setUp(self):
+        """Set up a throwaway project root."""
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.project_root = self.tmp_dir / "project"
+        self.logger = logging.getLogger('TestLogger')
+        self.file_ops = FileOperations(self.project_root, self.logger)
+
+    def tearDown(self):
+        """Remove the throwaway project root."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def make_snapshot_tree(self):
+        """Build a tree whose visible entries have a single possible order."""
+        tree = self.tmp_dir / "tree"
+        (tree / "a" / "b").mkdir(parents=True)
+        (tree / "node_modules").mkdir()
+        (tree / "top.txt").write_text("q\n", encoding="utf-8")
+        (tree / "a" / "m.py").write_text("x = 1\ny = 2\n", encoding="utf-8")
+        (tree / "a" / "b" / "r.md").write_text("hi", encoding="utf-8")
+
+        # ignored by extension, by name suffix and by directory
+        (tree / "c.pyc").write_bytes(b"\0")
+        (tree / ".gitignore").write_text("*\n", encoding="utf-8")
+        (tree / "a" / "package.json").write_text("{}", encoding="utf-8")
+        (tree / "node_modules" / "n.js").write_text("n", encoding="utf-8")
+
+        try:
+            os.symlink(tree / "a", tree / "a" / "b" / "loop", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks not available")
+        return tree
+
+    def snapshot(self, tree, include_contents):
+        """Run output_directory_structure and return the written lines."""
+        out = self.tmp_dir / "snapshot.txt"
+        self.file_ops.output_directory_structure(tree, out, include_contents)
+        return out.read_text(encoding="utf-8").splitlines()
+
+    def test_snapshot_without_contents(self):
+        """Test the snapshot skips ignored entries and does not follow symlinked dirs."""
+        tree = self.make_snapshot_tree()
+        self.assertEqual(self.snapshot(tree, False), [
+            "tree/",
+            "├── top.txt",
+            "│   a/",
+            "│   ├── m.py",
+            "│   │   b/",
+            "│   │   ├── r.md",
+        ])
+
+    def test_snapshot_with_contents(self):
+        """Test the snapshot writes each file's lines under its entry."""
+        tree = self.make_snapshot_tree()
+        self.assertEqual(self.snapshot(tree, True), [
+            "tree/",
+            "├── top.txt",
+            "│   q",
+            "│   a/",
+            "│   ├── m.py",
+            "│   │   x = 1",
+            "│   │   y = 2",
+            "│   │   b/",
+            "│   │   ├── r.md",
+            "│   │   │   hi",
+        ])
+
+    def test_snapshot_honours_instance_ignore_lists(self):
+        """Test that per-instance ignored_extensions and ignored_directories apply."""
+        tree = self.make_snapshot_tree()
+        self.file_ops.ignored_extensions = ['.md']
+        self.file_ops.ignored_directories = frozenset()
+        lines = self.snapshot(tree, False)
+        self.assertNotIn("│   │   ├── r.md", lines)
+        self.assertIn("├── c.pyc", lines)
+        self.assertIn("│   ├── package.json", lines)
+        self.assertIn("│   node_modules/", lines)
+
+    def build(self, structure):
+        """Write a structure file and create it under the project root."""
+        structure_file = self.tmp_dir / "structure.txt"
+        structure_file.write_text(structure, encoding="utf-8")
+        self.file_ops.create_structure_from_file(structure_file)
+
+    def test_duplicate_file_entries(self):
+        """Test that a repeated file entry is written once, last entry winning."""
+        self.build("same.txt\n    first\nsame.txt\n    second\n")
+        self.assertEqual(
+            (self.project_root / "same.txt").read_text(encoding="utf-8"),
+            "    second"
+        )
+
+    def test_directories_created_in_tree_order(self):
+        """Test that directories are created depth-first, in structure-file order."""
+        logger = logging.getLogger('TestTreeOrder')
+        with self.assertLogs(logger, level='INFO') as logs:
+            file_ops = FileOperations(self.project_root, logger)
+            structure_file = self.tmp_dir / "structure.txt"
+            structure_file.write_text("A/\n    A1/\n        f.txt\nB/\n", encoding="utf-8")
+            file_ops.create_structure_from_file(structure_file)
+        created = [
+            os.path.relpath(record.getMessage().split(": ", 1)[1], self.project_root)
+            for record in logs.records
+            if record.getMessage().startswith("Created directory: ")
+        ]
+        self.assertEqual(created, ["A", os.path.join("A", "A1"), "B"])
+
+    def test_deep_structure_without_recursion(self):
+        """Test a structure nested deeper than the default recursion limit."""
+        depth = 1200
+        lines = [" " * i + "d/" for i in range(depth)]
+        lines.append(" " * depth + "leaf.txt")
+        self.build("\n".join(lines) + "\n")
+        leaf = self.project_root.joinpath(*["d"] * depth, "leaf.txt")
+        try:
+            self.assertTrue(leaf.is_file())
+        finally:
+            # shutil.rmtree recurses per level, so unwind the chain by hand
+            leaf.unlink(missing_ok=True)
+            for directory in leaf.parents:
+                if directory == self.project_root:
+                    break
+                if directory.is_dir():
+                    directory.rmdir()
+
+    def test_unicode_whitespace_line_is_blank(self):
+        """Test that a line of non-ASCII whitespace is skipped like a blank line."""
+        self.build("pkg/\n    a.py\n│   \u00a0\n\u3000\n    b.py\n")
+        self.assertEqual(
+            sorted(p.name for p in self.project_root.iterdir()), ["pkg"]
+        )
+        self.assertEqual(
+            sorted(p.name for p in (self.project_root / "pkg").iterdir()),
+            ["a.py", "b.py"]
+        )
+
+    def test_create_file_bytes(self):
+        """Test that create_file writes the encoded content and truncates on rewrite."""
+        target = self.project_root / "sub" / "data.txt"
+        content = "héllo\nwörld\n"
+        self.file_ops.create_file(target, content)
+        self.assertEqual(
+            target.read_bytes(),
+            content.replace("\n", os.linesep).encode("utf-8")
+        )
+
+        self.file_ops.create_file(target, "x")
+        self.assertEqual(target.read_bytes(), b"x")
+
+    def test_sanitize_name_edge_cases(self):
+        """Test sanitize_name on dirty, empty and over-long names."""
+        cases = {
+            "invalid/name*file?.txt": "invalid_name_file_.txt",
+            "a  b (c).py": "a_b__c_.py",
+            "_x_": "x",
+            "": "untitled",
+            "  ": "untitled",
+            "___": "untitled",
+            "a**b": "a__b",
+            "tab\tname": "tab_name",
+            "[x]{y}": "x__y",
+            "nb\u00a0space": "nb_space",
+            "clean_name.py": "clean_name.py",
+        }
+        for name, expected in cases.items():
+            self.assertEqual(self.file_ops.sanitize_name(name), expected)
+
+        long_name = self.file_ops.sanitize_name("a" * 300 + ".txt")
+        self.assertEqual(len(long_name), MAX_NAME_LENGTH)
+        self.assertTrue(long_name.endswith(".txt"))
+
+    def test_sanitize_name_matches_reference(self):
+        """Test sanitize_name against the plain regex passes on random names."""
+        alphabet = 'ab._-/\\:*?"<>|#(){}[] \t\n\u00a0\u3000é'
+        rng = random.Random(0)
+        names = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            for _ in range(2000)
+        ]
+        names += ["x" * n + ".ext" for n in (250, 251, 252, 300)]
+        names += ["(" + "y" * 260 + ")", "z" * 256]
+        for name in names:
+            self.assertEqual(
+                self.file_ops.sanitize_name(name), reference_sanitize_name(name), repr(name)
+            )
+
+    def test_sanitize_name_non_ascii_replace_characters(self):
+        """Test that non-ASCII members of REPLACE_CHARACTERS are replaced."""
+        try:
+            with patch.object(settings, "REPLACE_CHARACTERS", REPLACE_CHARACTERS[:-1] + "…]"):
+                module = importlib.reload(file_operations)
+                self.assertEqual(module._sanitize_name("a…b"), "a_b")
+                self.assertEqual(module._sanitize_name("é…x.txt"), "é_x.txt")
+                self.assertEqual(module._sanitize_name("…"), "untitled")
+                self.assertEqual(module._sanitize_name("é*x"), "é_x")
+        finally:
+            importlib.reload(file_operations)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from project.src import logger as logger_module
+from project.src.logger import setup_logger
+import logging
+
+class TestSetupLogger(unittest.TestCase):
+    def setUp(self):
+        """Set up a throwaway log directory."""
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.log_file = str(self.tmp_dir / "test.log")
+        self.loggers = []
+
+    def tearDown(self):
+        """Detach the handlers the test attached and remove the log directory."""
+        for logger in self.loggers:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            logger_module._configured.discard((logger.name, self.log_file))
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def setup(self, name):
+        """Call setup_logger and remember the logger for cleanup."""
+        logger = setup_logger(name, self.log_file)
+        self.loggers.append(logger)
+        return logger
+
+    def test_repeated_setup_attaches_one_handler(self):
+        """Test that setup_logger is idempotent for an unconfigured logger name."""
+        first = self.setup('FSOpsCreate')
+        second = self.setup('FSOpsCreate')
+        self.assertIs(first, second)
+        self.assertEqual(len(first.handlers), 1)
+        self.assertEqual(first.level, logging.INFO)
+
+    def test_records_buffer_until_an_error(self):
+        """Test that records stay in memory until an ERROR record flushes them."""
+        logger = self.setup('FSOpsOutput')
+        logger.info("buffered")
+        self.assertEqual(Path(self.log_file).read_text(encoding='utf-8'), "")
+
+        logger.error("failed")
+        lines = Path(self.log_file).read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith("INFO - buffered"))
+        self.assertTrue(lines[1].endswith("ERROR - failed"))
+
+    def test_missing_log_directory_is_created(self):
+        """Test that setup_logger creates the log file's parent directories."""
+        self.log_file = str(self.tmp_dir / "nested" / "logs" / "test.log")
+        logger = self.setup('FSOpsRecreate')
+        logger.error("written")
+        self.assertTrue(Path(self.log_file).is_file())
+
+if __name__ == "__main__":
+    unittest.main()
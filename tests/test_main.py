@@ -0,0 +1,68 @@
+import unittest
+import io
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from project.src import cli
+import logging
+
+class TestCliMain(unittest.TestCase):
+    def setUp(self):
+        """Set up a throwaway working directory and log file."""
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.log_file = str(self.tmp_dir / "cli.log")
+
+    def tearDown(self):
+        """Detach the CLI logger's handlers and remove the working directory."""
+        logger = logging.getLogger("FileSystemToolCLI")
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def run_cli(self, *argv):
+        """Run cli.main() with the given arguments; return (exit code, stdout)."""
+        out = io.StringIO()
+        with patch("sys.argv", ["cli", "--log-level", "CRITICAL", "--log-file", self.log_file, *argv]):
+            with redirect_stdout(out):
+                code = cli.main()
+        return code, out.getvalue()
+
+    def test_commands_route_to_their_handlers(self):
+        """Test that each subcommand dispatches to its DISPATCH entry."""
+        for command, argv in {
+            "blueprint": ["blueprint", "structure.txt"],
+            "snapshoot": ["snapshoot", "some_dir", "-c"],
+            "recreate": ["recreate", "structure.txt", "contents.txt"],
+        }.items():
+            handler = MagicMock()
+            with patch.dict(cli.DISPATCH, {command: handler}):
+                code, _ = self.run_cli(*argv)
+            self.assertEqual(code, 0)
+            handler.assert_called_once()
+            args, _ = handler.call_args.args
+            self.assertEqual(args.command, command)
+
+    def test_blueprint_creates_structure(self):
+        """Test that blueprint builds the structure file under --root."""
+        structure_file = self.tmp_dir / "structure.txt"
+        structure_file.write_text("pkg/\n    mod.py\n        x = 1\n", encoding="utf-8")
+        root = self.tmp_dir / "out"
+        code, _ = self.run_cli("blueprint", str(structure_file), "--root", str(root))
+        self.assertEqual(code, 0)
+        self.assertTrue((root / "pkg" / "mod.py").is_file())
+
+    def test_recreate_reports_not_implemented(self):
+        """Test that recreate fails with a clear message and a non-zero exit code."""
+        code, out = self.run_cli("recreate", "structure.txt", "contents.txt")
+        self.assertEqual(code, 1)
+        self.assertIn("recreate is not implemented", out)
+
+    def test_install_is_not_a_command(self):
+        """Test that the CLI exposes no install command."""
+        self.assertNotIn("install", cli.DISPATCH)
+
+if __name__ == "__main__":
+    unittest.main()